@@ -190,14 +190,24 @@ def git_repo(root, tmp_path, monkeypatch):
     remote_dir = tmp_path / "remote.git"
     local_dir = tmp_path / "local"
 
-    # 1. Create bare remote
+    # 1. Create bare remote whose default HEAD points to master for predictable behavior
     remote_dir.mkdir()
-    subprocess.run([GIT, "init", "--bare", str(remote_dir)], check=True)
-    # Ensure the remote's default HEAD points to master for predictable behavior
-    subprocess.run([GIT, "symbolic-ref", "HEAD", "refs/heads/master"], cwd=remote_dir, check=True)
+    subprocess.run([GIT, "init", "--bare", "--initial-branch=master", str(remote_dir)], check=True)
 
-    # 2. Clone to local
-    subprocess.run([GIT, "clone", str(remote_dir), str(local_dir)], check=True)
+    # 2. Clone to local, writing the commit identity into the clone's config in the same call
+    subprocess.run(
+        [
+            GIT,
+            "clone",
+            "--config",
+            "user.email=test@example.com",
+            "--config",
+            "user.name=Test User",
+            str(remote_dir),
+            str(local_dir),
+        ],
+        check=True,
+    )
 
     # Use monkeypatch to safely change cwd for the duration of the test
     monkeypatch.chdir(local_dir)
@@ -252,8 +262,6 @@ def git_repo(root, tmp_path, monkeypatch):
     (script_dir / "release.sh").chmod(0o755)
 
     # Commit and push initial state
-    subprocess.run([GIT, "config", "user.email", "test@example.com"], check=True)
-    subprocess.run([GIT, "config", "user.name", "Test User"], check=True)
     subprocess.run([GIT, "add", "."], check=True)
     subprocess.run([GIT, "commit", "-m", "Initial commit"], check=True)
     subprocess.run([GIT, "push", "origin", "master"], check=True)
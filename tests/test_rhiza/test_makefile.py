@@ -68,13 +68,16 @@ def setup_tmp_makefile(logger, root, tmp_path: Path):
     logger.debug("Copied Makefile from %s to %s", root / "Makefile", tmp_path / "Makefile")
 
     # Copy split Makefiles if they exist (maintaining directory structure)
+    copied = []
     for split_file in SPLIT_MAKEFILES:
         source_path = root / split_file
         if source_path.exists():
             dest_path = tmp_path / split_file
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy(source_path, dest_path)
-            logger.debug("Copied %s to %s", source_path, dest_path)
+            copied.append(split_file)
+    if copied:
+        logger.debug("Copied split Makefiles %s from %s to %s", copied, root, tmp_path)
 
     # Move into tmp directory for isolation
     old_cwd = Path.cwd()
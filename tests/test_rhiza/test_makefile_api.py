@@ -44,14 +44,11 @@ def setup_api_env(logger, root, tmp_path: Path):
         else:
             pytest.fail(f"Required file {filename} not found in root")
 
-    # Copy required directories
+    # Copy required directories (tmp_path is fresh, so destinations never pre-exist)
     for folder in REQUIRED_FOLDERS:
         src = root / folder
         if src.exists():
-            dest = tmp_path / folder
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
+            shutil.copytree(src, tmp_path / folder)
         else:
             pytest.fail(f"Required folder {folder} not found in root")
 
@@ -59,15 +56,11 @@ def setup_api_env(logger, root, tmp_path: Path):
     for folder in OPTIONAL_FOLDERS:
         src = root / folder
         if src.exists():
-            dest = tmp_path / folder
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(src, dest)
+            shutil.copytree(src, tmp_path / folder)
 
     # Create .rhiza/make.d and ensure no local.mk exists initially
     (tmp_path / ".rhiza" / "make.d").mkdir(parents=True, exist_ok=True)
-    if (tmp_path / "local.mk").exists():
-        (tmp_path / "local.mk").unlink()
+    (tmp_path / "local.mk").unlink(missing_ok=True)
 
     # Initialize git repo for rhiza tools (required for sync/validate)
     subprocess.run([GIT, "init"], cwd=tmp_path, check=True, capture_output=True)
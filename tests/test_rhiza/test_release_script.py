@@ -110,11 +110,20 @@ def test_release_fails_if_behind_remote(git_repo):
     # Create a commit on remote that isn't local
     # We need to clone another repo to push to remote
     other_clone = git_repo.parent / "other_clone"
-    subprocess.run([GIT, "clone", str(git_repo.parent / "remote.git"), str(other_clone)], check=True)
-
-    # Configure git user for other_clone (needed in CI)
-    subprocess.run([GIT, "config", "user.email", "test@example.com"], cwd=other_clone, check=True)
-    subprocess.run([GIT, "config", "user.name", "Test User"], cwd=other_clone, check=True)
+    # Configure git user for other_clone at clone time (needed in CI)
+    subprocess.run(
+        [
+            GIT,
+            "clone",
+            "--config",
+            "user.email=test@example.com",
+            "--config",
+            "user.name=Test User",
+            str(git_repo.parent / "remote.git"),
+            str(other_clone),
+        ],
+        check=True,
+    )
 
     # Commit and push from other clone
     with open(other_clone / "other.txt", "w") as f: